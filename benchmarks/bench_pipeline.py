@@ -0,0 +1,139 @@
+"""
+Memory benchmark for the story pipeline (feed -> summarize -> report).
+
+Runs each (mode, story count) in a fresh interpreter with an instant fake LLM, so only
+pipeline overhead is measured:
+
+  baseline  the pre-dataclass flow: story dicts, NewsItem validate + model_dump,
+            a title->link map and one markdown/HTML render of the whole report
+  pipeline  extract_entries -> summarize_stories -> ProgressiveReportWriter
+
+Reported per run: tracemalloc peak of the feed parse and of the summarize/render
+phase (total and per story), and the process max RSS.
+
+Usage:
+  python benchmarks/bench_pipeline.py --stories 100 1000 5000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import resource
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+
+def build_feed_xml(n: int) -> str:
+    items = "".join(
+        f"<item><title>Story {i} headline about something</title>"
+        f"<link>https://news.google.com/rss/articles/ID{i}?oc=5</link>"
+        f"<pubDate>Mon, 19 Oct 2026 08:00:00 GMT</pubDate>"
+        f"<description>&lt;a href=&quot;x&quot;&gt;Snippet {i}&lt;/a&gt; with some context text.</description>"
+        f"<source url=\"https://example.com\">Example {i % 7}</source></item>"
+        for i in range(n)
+    )
+    return f"<?xml version=\"1.0\"?><rss version=\"2.0\"><channel><title>Bench</title>{items}</channel></rss>"
+
+
+class FakeLLM:
+    def generate_text(self, prompt: str) -> str:
+        title = prompt.split("Title: ", 1)[1].split("\n", 1)[0]
+        return json.dumps({"Title": title, "News Summary": "A short neutral summary sentence. " * 8})
+
+
+def run_baseline(feed, out_path: str) -> None:
+    from news_summarizer.report import markdown_to_html, write_html, wrap_html
+    from news_summarizer.schema import NewsItem
+    from news_summarizer.utils import extract_first_json_object
+
+    stories = [
+        {
+            "title": e.get("title", "").strip(),
+            "link": e.get("link", "").strip(),
+            "published": e.get("published", "").strip(),
+            "source": (e.get("source") or {}).get("title", ""),
+            "summary": e.get("summary", "").strip(),
+        }
+        for e in feed.entries
+    ]
+    llm = FakeLLM()
+    items = []
+    for s in stories:
+        text = llm.generate_text(f"Title: {s['title']}\n{s['summary']}")
+        items.append(NewsItem.model_validate(json.loads(extract_first_json_object(text))).model_dump(by_alias=True))
+
+    link_map = {s["title"]: s["link"] for s in stories}
+    lines = []
+    for i, item in enumerate(items, start=1):
+        lines += [f"## {i}. [{item['Title']}]({link_map.get(item['Title'], '')})", "", item["News Summary"], "", "---", ""]
+    write_html(out_path, wrap_html([markdown_to_html("\n".join(lines))]))
+
+
+def run_pipeline(feed, out_path: str) -> None:
+    from news_summarizer.report import ProgressiveReportWriter
+    from news_summarizer.rss import count_entries, extract_entries
+    from news_summarizer.summarizer import summarize_stories
+
+    total = count_entries(feed, limit=len(feed.entries))
+    writer = ProgressiveReportWriter(out_path, rss_url="bench", llm_provider="fake", total=total)
+    logger = logging.getLogger("bench")
+    for item in summarize_stories(FakeLLM(), extract_entries(feed, total), 450, False, logger, "English", total=total):
+        writer.add(item)
+    writer.finish()
+
+
+def run_one(mode: str, n: int) -> dict:
+    import feedparser
+    import markdown  # noqa: F401  (import cost is not part of the measurement)
+
+    from news_summarizer.schema import NewsItem  # noqa: F401
+
+    xml = build_feed_xml(n)
+    tracemalloc.start()
+    feed = feedparser.parse(xml)
+    parse_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        (run_baseline if mode == "baseline" else run_pipeline)(feed, str(Path(tmp) / "index.html"))
+
+    peak = tracemalloc.get_traced_memory()[1] - base
+    tracemalloc.stop()
+    rss_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss  # KiB on Linux
+    return {"mode": mode, "stories": n, "parse_peak": parse_peak, "peak": peak, "rss_kib": rss_kib}
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    p.add_argument("--stories", type=int, nargs="+", default=[100, 1000, 5000])
+    p.add_argument("--modes", nargs="+", default=["baseline", "pipeline"])
+    p.add_argument("--one", nargs=2, metavar=("MODE", "N"), help=argparse.SUPPRESS)
+    args = p.parse_args()
+
+    if args.one:
+        logging.disable(logging.CRITICAL)
+        print(json.dumps(run_one(args.one[0], int(args.one[1]))))
+        return
+
+    print(f"{'mode':<10} {'stories':>8} {'parse peak KiB':>15} {'run peak KiB':>13} {'B/story':>8} {'max RSS MiB':>12}")
+    for n in args.stories:
+        for mode in args.modes:
+            proc = subprocess.run(
+                [sys.executable, __file__, "--one", mode, str(n)], capture_output=True, text=True, check=True
+            )
+            r = json.loads(proc.stdout.strip().splitlines()[-1])
+            print(
+                f"{r['mode']:<10} {r['stories']:>8} {r['parse_peak'] / 1024:>15.0f} {r['peak'] / 1024:>13.0f} "
+                f"{r['peak'] / n:>8.0f} {r['rss_kib'] / 1024:>12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
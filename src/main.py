@@ -7,11 +7,20 @@ import webbrowser
 
 from dotenv import load_dotenv
 
-from news_summarizer.llm.factory import build_provider_from_env
+import news_summarizer.report as report_module
+import news_summarizer.rss as rss_module
 from news_summarizer.llm.base import LLMBlockedByRegionError
 from news_summarizer.llm.factory import build_provider
-from news_summarizer.report import build_markdown_report, markdown_to_html, wrap_html, write_html
-from news_summarizer.rss import extract_entries, fetch_google_news_top_stories
+from news_summarizer.profiling import Profiler, profile_dir_for
+from news_summarizer.report import ProgressiveReportWriter
+from news_summarizer.rss import (
+    FeedSection,
+    count_entries,
+    fetch_feeds,
+    fetch_google_news_top_stories,
+    iter_unique_stories,
+    section_keys,
+)
 from news_summarizer.summarizer import summarize_stories
 
 
@@ -28,6 +37,19 @@ def build_arg_parser() -> argparse.ArgumentParser:
     p.add_argument("--llm", type=str, default=None, help="openai or ollama")
     p.add_argument("--log-level", type=str, default="INFO")
     p.add_argument("--refresh-geoip", action="store_true", help="Ignore geoip cache and re-detect location.")
+    p.add_argument("--stream", action="store_true", help="Stream tokens and stop once the summary JSON is complete.")
+    p.add_argument(
+        "--sections",
+        type=str,
+        default=None,
+        help="Comma-separated sections, e.g. top,business,technology,science,search:climate. "
+        "--limit applies per section.",
+    )
+    p.add_argument(
+        "--profile",
+        action="store_true",
+        help="Capture cProfile/tracemalloc per pipeline stage and import times into <output>.profile/.",
+    )
     return p
 
 def language_instruction_from_locale(locale_lang: str) -> str:
@@ -48,6 +70,27 @@ def language_instruction_from_locale(locale_lang: str) -> str:
 
     return "English"
 
+def build_sections(locale, spec: str) -> list:
+    from news_summarizer.localize import build_google_news_rss_url
+
+    sections = []
+    for part in spec.split(","):
+        name = part.strip()
+        if not name:
+            continue
+        if name.lower() == "top":
+            sections.append(FeedSection("Top Stories", build_google_news_rss_url(locale)))
+        elif name.lower().startswith("search:"):
+            query = name.split(":", 1)[1].strip()
+            sections.append(FeedSection(f"Search: {query}", build_google_news_rss_url(locale, query=query)))
+        else:
+            try:
+                url = build_google_news_rss_url(locale, topic=name)
+            except ValueError as e:
+                raise SystemExit(str(e))
+            sections.append(FeedSection(name.title(), url))
+    return sections
+
 def main() -> None:
     load_dotenv()
 
@@ -58,6 +101,17 @@ def main() -> None:
     )
     logger = logging.getLogger("news_summarizer")
 
+    profiler = Profiler(enabled=args.profile)
+    profiler.instrument(rss_module, ["extract_entries"])
+    profiler.instrument(
+        report_module,
+        ["build_markdown_header", "build_markdown_card", "build_markdown_section", "markdown_to_html", "wrap_html", "write_html"],
+    )
+    if args.profile:
+        # Load the lazily-imported renderer as its own stage, so its cost isn't charged to the first markdown_to_html.
+        with profiler.stage("import_markdown"):
+            report_module.load_markdown()
+
     if args.llm:
         os.environ["LLM_PROVIDER"] = args.llm.strip().lower()
     
@@ -65,69 +119,99 @@ def main() -> None:
 
     from news_summarizer.localize import resolve_locale, build_google_news_rss_url
 
-    locale = resolve_locale(force_refresh=args.refresh_geoip)
+    with profiler.stage("resolve_locale"):
+        locale = resolve_locale(force_refresh=args.refresh_geoip)
     
-    if args.rss:
-        rss_url = args.rss
-    elif os.getenv("GOOGLE_NEWS_RSS"):
-        rss_url = os.getenv("GOOGLE_NEWS_RSS")
+    if args.sections:
+        sections = build_sections(locale, args.sections)
+        if not sections:
+            raise SystemExit("No sections given.")
     else:
-        rss_url = build_google_news_rss_url(locale)
-
+        if args.rss:
+            rss_url = args.rss
+        elif os.getenv("GOOGLE_NEWS_RSS"):
+            rss_url = os.getenv("GOOGLE_NEWS_RSS")
+        else:
+            rss_url = build_google_news_rss_url(locale)
+        sections = [FeedSection("Top Stories", rss_url)]
+
+    rss_url = ", ".join(s.rss_url for s in sections)
     logger.info("Resolved RSS URL: %s", rss_url)
     # Decide LLM output language from locale
     target_language = language_instruction_from_locale(locale.lang)
     logger.info("Target summary language: %s", target_language)
 
     primary_provider = (os.getenv("LLM_PROVIDER") or "openai").strip().lower()
-    llm = build_provider(primary_provider)
-
-    logger.info("Fetching RSS feed: %s", rss_url)
-    feed = fetch_google_news_top_stories(rss_url)
-    stories = extract_entries(feed, limit=args.limit)
-    if not stories:
+    llm = build_provider(primary_provider, max_chars=args.max_chars)
+
+    if len(sections) == 1:
+        logger.info("Fetching RSS feed: %s", rss_url)
+        with profiler.stage("fetch_google_news_top_stories"):
+            feeds = [fetch_google_news_top_stories(sections[0].rss_url)]
+        total = count_entries(feeds[0], limit=args.limit)
+        report_sections = None
+    else:
+        logger.info("Fetching %d RSS feeds concurrently", len(sections))
+        with profiler.stage("fetch_feeds"):
+            feeds = fetch_feeds([s.rss_url for s in sections])
+        keys = section_keys(feeds, limit=args.limit)
+        total = len({k for section in keys for k in section})
+        report_sections = [(s.title, k) for s, k in zip(sections, keys)]
+        logger.info("Merged %d section entries into %d unique stories", sum(len(k) for k in keys), total)
+    if not total:
         raise SystemExit("No stories found. RSS may be blocked or returned empty.")
 
     llm_provider_name = (os.getenv("LLM_PROVIDER") or "openai").strip().lower()
-    llm = build_provider(llm_provider_name)
+    llm = build_provider(llm_provider_name, max_chars=args.max_chars)
 
-    try:
+    writer = ProgressiveReportWriter(
+        args.output, rss_url=rss_url, llm_provider=llm_provider_name, total=total, sections=report_sections
+    )
+
+    def stories():
+        # A single feed is passed through as-is; multiple feeds are merged so shared stories are summarized once.
+        # Looked up on the module so the --profile wrapper applies.
+        if len(feeds) == 1:
+            return rss_module.extract_entries(feeds[0], limit=args.limit)
+        return iter_unique_stories(feeds, limit=args.limit)
+
+    def run_summaries() -> None:
+        # Stories stream from the parsed feeds straight into the report.
         items = summarize_stories(
             llm=llm,
-            stories=stories,
+            stories=stories(),
             max_chars=args.max_chars,
             fail_fast=args.fail_fast,
             logger=logger,
             target_language=target_language,
+            stream=args.stream,
+            total=total,
         )
+        for item in profiler.iterate("summarize_stories", items):
+            writer.add(item)
+
+    try:
+        run_summaries()
 
     except LLMBlockedByRegionError:
         logger.warning("OpenAI blocked in this region. Falling back to Ollama.")
         llm_provider_name = "ollama"
-        llm = build_provider("ollama")
+        llm = build_provider("ollama", max_chars=args.max_chars)
+        writer.reset(llm_provider_name)
 
-        items = summarize_stories(
-            llm=llm,
-            stories=stories,
-            max_chars=args.max_chars,
-            fail_fast=args.fail_fast,
-            logger=logger,
-            target_language=target_language,
-        )
+        run_summaries()
 
     except Exception:
-        # last-resort: don't crash; show empty report with a visible note
+        # last-resort: don't crash; keep whatever was summarized so far
         logger.exception("Summarization failed unexpectedly.")
-        items = []
 
 
-    markdown_report = build_markdown_report(items, rss_url=rss_url, stories=stories, llm_provider=llm_provider_name)
-    body_html = markdown_to_html(markdown_report)
-    full_html = wrap_html(body_html)
-
-    abs_path = write_html(args.output, full_html)
+    abs_path = writer.finish()
     logger.info("Saved HTML report: %s", abs_path)
 
+    if args.profile:
+        logger.info("Saved profile: %s", profiler.write(profile_dir_for(args.output)))
+
     if not args.no_open:
         webbrowser.open(f"file:///{abs_path.replace(os.sep, '/')}")
 
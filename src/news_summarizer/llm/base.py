@@ -1,11 +1,20 @@
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Iterator, Protocol, runtime_checkable
 
 
 class LLMProvider(Protocol):
     def generate_text(self, prompt: str) -> str:
         """Return raw model text output."""
 
+
+@runtime_checkable
+class StreamingLLMProvider(Protocol):
+    def generate_text(self, prompt: str) -> str:
+        """Return raw model text output."""
+
+    def stream_text(self, prompt: str) -> Iterator[str]:
+        """Yield raw model text chunks as they are generated. Closing the iterator stops generation."""
+
 class LLMBlockedByRegionError(RuntimeError):
-    pass
\ No newline at end of file
+    pass
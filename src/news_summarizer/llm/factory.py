@@ -1,17 +1,27 @@
 from __future__ import annotations
 
 import os
+import re
+from typing import Union
 
 from news_summarizer.llm.base import LLMProvider
-from news_summarizer.llm.openai_provider import OpenAIConfig, OpenAIProvider
-from news_summarizer.llm.ollama_provider import OllamaConfig, OllamaProvider
-from news_summarizer.models import NewsItem
 
 
-def build_provider(provider: str) -> LLMProvider:
+def _parse_keep_alive(value: str) -> Union[str, int]:
+    # Ollama reads a JSON string as a Go duration ("10m", "1h"); bare numbers must be sent as ints.
+    value = value.strip()
+    if re.fullmatch(r"-?\d+", value):
+        return int(value)
+    return value
+
+
+def build_provider(provider: str, max_chars: int = 450) -> LLMProvider:
+    # Provider modules (and their SDKs / schema models) are imported only when selected.
     provider = provider.strip().lower()
 
     if provider == "openai":
+        from news_summarizer.llm.openai_provider import OpenAIConfig, OpenAIProvider
+
         api_key = os.getenv("OPENAI_API_KEY", "").strip()
         if not api_key:
             raise SystemExit("Missing OPENAI_API_KEY for OpenAI provider.")
@@ -19,14 +29,27 @@ def build_provider(provider: str) -> LLMProvider:
         return OpenAIProvider(OpenAIConfig(api_key=api_key, model=model))
 
     if provider == "ollama":
+        from news_summarizer.llm.ollama_provider import OllamaConfig, OllamaProvider
+        from news_summarizer.schema import NewsItem
+
         host = (os.getenv("OLLAMA_HOST") or "http://localhost:11434").strip()
         model = (os.getenv("OLLAMA_MODEL") or "llama3.2").strip()
         timeout_s = int(os.getenv("OLLAMA_TIMEOUT_S") or "180")
+        cfg = OllamaConfig(
+            host=host,
+            model=model,
+            timeout_s=timeout_s,
+            keep_alive=_parse_keep_alive(os.getenv("OLLAMA_KEEP_ALIVE") or "10m"),
+            num_ctx=int(os.getenv("OLLAMA_NUM_CTX") or "0"),
+            num_predict=int(os.getenv("OLLAMA_NUM_PREDICT") or "0"),
+            max_chars=max_chars,
+            parallel=int(os.getenv("OLLAMA_NUM_PARALLEL") or "1"),
+        )
         schema = NewsItem.model_json_schema()
-        return OllamaProvider(OllamaConfig(host=host, model=model, timeout_s=timeout_s), schema=schema)
+        return OllamaProvider(cfg, schema=schema)
 
     raise SystemExit(f"Unknown provider: {provider}")
 
 
-def build_provider_from_env() -> LLMProvider:
-    return build_provider(os.getenv("LLM_PROVIDER") or "openai")
+def build_provider_from_env(max_chars: int = 450) -> LLMProvider:
+    return build_provider(os.getenv("LLM_PROVIDER") or "openai", max_chars=max_chars)
@@ -1,15 +1,77 @@
 from __future__ import annotations
 
+import json
+import logging
+import threading
 from dataclasses import dataclass
-from typing import Optional
+from typing import Iterator, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# Output budget (num_predict, and the output share of num_ctx): the summary at ~2 tokens
+# per char (llama3 often needs more than one token per CJK char), plus JSON keys, quotes
+# and the echoed title.
+_TOKENS_PER_SUMMARY_CHAR = 2
+_OUTPUT_OVERHEAD_TOKENS = 128
+# Context windows are bucketed so that consecutive calls reuse the same size;
+# Ollama reloads the model whenever num_ctx changes.
+_MIN_NUM_CTX = 1024
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Cheap, conservative token estimate without a tokenizer.
+    ASCII text averages ~3-4 chars per token; CJK and other scripts often take 1-2+ tokens per char.
+    """
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return ascii_chars // 3 + _TOKENS_PER_SUMMARY_CHAR * (len(text) - ascii_chars) + 1
+
+
+def _bucket_num_ctx(tokens: int) -> int:
+    size = _MIN_NUM_CTX
+    while size < tokens:
+        size *= 2
+    return size
+
 
 @dataclass(frozen=True)
 class OllamaConfig:
     host: str
     model: str
     timeout_s: int = 180
+    keep_alive: Union[str, int] = "10m"  # duration string, or seconds (-1 = forever, 0 = unload)
+    num_ctx: int = 0         # 0 = size from prompt + output budget
+    num_predict: int = 0     # 0 = size from max_chars, -1 = no cap
+    max_chars: int = 450
+    parallel: int = 1        # match the server's OLLAMA_NUM_PARALLEL
+
+
+@dataclass
+class OllamaTimings:
+    calls: int = 0
+    load_ns: int = 0
+    prompt_eval_ns: int = 0
+    eval_ns: int = 0
+    total_ns: int = 0
+    prompt_tokens: int = 0
+    eval_tokens: int = 0
+    stopped_early: int = 0  # streamed calls closed before Ollama sent its final timings
+
+    def summary(self) -> str:
+        def s(ns: int) -> str:
+            return f"{ns / 1e9:.1f}s"
+
+        tok_s = self.eval_tokens / (self.eval_ns / 1e9) if self.eval_ns else 0.0
+        return (
+            f"{self.calls} calls"
+            + (f" ({self.stopped_early} stopped early, no server timings)" if self.stopped_early else "")
+            + f", total {s(self.total_ns)} "
+            f"(load {s(self.load_ns)}, prompt eval {s(self.prompt_eval_ns)} / {self.prompt_tokens} tok, "
+            f"eval {s(self.eval_ns)} / {self.eval_tokens} tok, {tok_s:.1f} tok/s)"
+        )
 
 
 class OllamaProvider:
@@ -18,14 +80,112 @@ class OllamaProvider:
         self.schema = schema
         self._endpoint = cfg.host.rstrip("/") + "/api/generate"
 
-    def generate_text(self, prompt: str) -> str:
-        payload = {"model": self.cfg.model, "prompt": prompt, "stream": False}
+        # One pooled session for all calls; size the pool to the number of concurrent requests.
+        self.concurrency = max(1, cfg.parallel)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        self._num_ctx = cfg.num_ctx
+        self._lock = threading.Lock()
+        self.timings = OllamaTimings()
+
+    def _output_budget(self) -> int:
+        if self.cfg.num_predict > 0:
+            return self.cfg.num_predict
+        return _TOKENS_PER_SUMMARY_CHAR * self.cfg.max_chars + _OUTPUT_OVERHEAD_TOKENS
+
+    def _context_size(self, prompt: str) -> int:
+        if self.cfg.num_ctx > 0:
+            return self.cfg.num_ctx
+        needed = _bucket_num_ctx(estimate_tokens(prompt) + self._output_budget())
+        with self._lock:
+            # Only ever grow, so a short prompt never forces a reload after a long one.
+            self._num_ctx = max(self._num_ctx, needed)
+            return self._num_ctx
+
+    def _build_options(self, prompt: str) -> dict:
+        options = {
+            "num_ctx": self._context_size(prompt),
+            # Bounds a runaway generation; the budget leaves room for CJK summaries at max_chars.
+            "num_predict": -1 if self.cfg.num_predict < 0 else self._output_budget(),
+        }
+        if self.schema is not None:
+            options["temperature"] = 0
+        return options
+
+    def _record_timings(self, data: dict) -> None:
+        load_ns = int(data.get("load_duration") or 0)
+        prompt_eval_ns = int(data.get("prompt_eval_duration") or 0)
+        eval_ns = int(data.get("eval_duration") or 0)
+        prompt_tokens = int(data.get("prompt_eval_count") or 0)
+        eval_tokens = int(data.get("eval_count") or 0)
+
+        logger.debug(
+            "Ollama timings: load=%.2fs prompt_eval=%.2fs (%d tok) eval=%.2fs (%d tok)",
+            load_ns / 1e9, prompt_eval_ns / 1e9, prompt_tokens, eval_ns / 1e9, eval_tokens,
+        )
+
+        with self._lock:
+            t = self.timings
+            t.calls += 1
+            t.load_ns += load_ns
+            t.prompt_eval_ns += prompt_eval_ns
+            t.eval_ns += eval_ns
+            t.total_ns += int(data.get("total_duration") or 0)
+            t.prompt_tokens += prompt_tokens
+            t.eval_tokens += eval_tokens
+
+    def timing_summary(self) -> str:
+        with self._lock:
+            return self.timings.summary()
+
+    def _build_payload(self, prompt: str, stream: bool) -> dict:
+        payload = {
+            "model": self.cfg.model,
+            "prompt": prompt,
+            "stream": stream,
+            "keep_alive": self.cfg.keep_alive,
+            "options": self._build_options(prompt),
+        }
 
         if self.schema is not None:
             payload["format"] = self.schema
-            payload["options"] = {"temperature": 0}
+        return payload
 
-        r = requests.post(self._endpoint, json=payload, timeout=self.cfg.timeout_s)
+    def generate_text(self, prompt: str) -> str:
+        payload = self._build_payload(prompt, stream=False)
+        r = self._session.post(self._endpoint, json=payload, timeout=self.cfg.timeout_s)
         r.raise_for_status()
         data = r.json()
+        self._record_timings(data)
         return (data.get("response") or "").strip()
+
+    def stream_text(self, prompt: str) -> Iterator[str]:
+        payload = self._build_payload(prompt, stream=True)
+        r = self._session.post(self._endpoint, json=payload, timeout=self.cfg.timeout_s, stream=True)
+        done = False
+        try:
+            r.raise_for_status()
+            for line in r.iter_lines():
+                if not line:
+                    continue
+                data = json.loads(line)
+                if data.get("error"):
+                    done = True  # failed calls aren't counted, same as generate_text
+                    raise RuntimeError(f"Ollama error: {data['error']}")
+                chunk = data.get("response") or ""
+                if chunk:
+                    yield chunk
+                if data.get("done"):
+                    done = True
+                    self._record_timings(data)
+                    return
+        finally:
+            # Closing mid-stream drops the connection, which makes Ollama cancel the generation.
+            r.close()
+            if not done:
+                with self._lock:
+                    self.timings.calls += 1
+                    self.timings.stopped_early += 1
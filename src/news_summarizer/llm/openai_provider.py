@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Iterator
 
 from news_summarizer.llm.base import LLMBlockedByRegionError
 
@@ -21,8 +22,38 @@ class OpenAIProvider:
             resp = self._client.responses.create(model=self.cfg.model, input=prompt)
             return (resp.output_text or "").strip()
         except Exception as e:
-            # The OpenAI SDK raises PermissionDeniedError; message contains unsupported_country_region_territory
-            msg = str(e)
-            if "unsupported_country_region_territory" in msg:
-                raise LLMBlockedByRegionError(msg) from e
+            _raise_if_region_blocked(e)
             raise
+
+    def stream_text(self, prompt: str) -> Iterator[str]:
+        try:
+            stream = self._client.responses.create(model=self.cfg.model, input=prompt, stream=True)
+        except Exception as e:
+            _raise_if_region_blocked(e)
+            raise
+
+        try:
+            for event in stream:
+                if event.type == "response.output_text.delta":
+                    yield event.delta
+                elif event.type in ("error", "response.failed"):
+                    _raise_stream_error(event)
+        finally:
+            # Closing the HTTP stream early stops billing for the remaining tokens.
+            stream.close()
+
+
+def _raise_stream_error(event) -> None:
+    # "error" events carry the message directly; "response.failed" carries it on response.error.
+    error = getattr(getattr(event, "response", None), "error", None) or event
+    msg = getattr(error, "message", None) or str(error)
+    err = RuntimeError(f"OpenAI stream {event.type}: {msg}")
+    _raise_if_region_blocked(err)
+    raise err
+
+
+def _raise_if_region_blocked(e: Exception) -> None:
+    # The OpenAI SDK raises PermissionDeniedError; message contains unsupported_country_region_territory
+    msg = str(e)
+    if "unsupported_country_region_territory" in msg:
+        raise LLMBlockedByRegionError(msg) from e
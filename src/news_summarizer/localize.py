@@ -6,6 +6,7 @@ import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
+from urllib.parse import quote_plus
 
 import requests
 
@@ -54,6 +55,18 @@ CEID_LANG_OVERRIDE = {
     "CN": "zh-Hans",
 }
 
+# Google News topic feeds (/rss/headlines/section/topic/<TOPIC>)
+GOOGLE_NEWS_TOPICS = (
+    "WORLD",
+    "NATION",
+    "BUSINESS",
+    "TECHNOLOGY",
+    "ENTERTAINMENT",
+    "SCIENCE",
+    "SPORTS",
+    "HEALTH",
+)
+
 # --------------------------
 # Cache (avoid rate limits)
 # --------------------------
@@ -138,14 +151,21 @@ def detect_country_via_geoip(timeout_s: int = 6, force_refresh: bool = False) ->
 # RSS builder
 # --------------------------
 
-def build_google_news_rss_url(locale: Locale) -> str:
+def build_google_news_rss_url(locale: Locale, topic: Optional[str] = None, query: Optional[str] = None) -> str:
     """
-    Build a localized Google News RSS URL.
+    Build a localized Google News RSS URL (top stories, a topic section, or a search).
 
     Example:
       Locale(country="TW", lang="zh-TW")
       -> https://news.google.com/rss?hl=zh-TW&gl=TW&ceid=TW:zh-Hant
+      Locale(country="TW", lang="zh-TW"), topic="BUSINESS"
+      -> https://news.google.com/rss/headlines/section/topic/BUSINESS?hl=zh-TW&gl=TW&ceid=TW:zh-Hant
+      Locale(country="US", lang="en-US"), query="climate change"
+      -> https://news.google.com/rss/search?q=climate+change&hl=en-US&gl=US&ceid=US:en
     """
+    if topic and query:
+        raise ValueError("Pass either topic or query, not both.")
+
     country = locale.country.upper()
     hl = locale.lang.strip()
 
@@ -154,7 +174,18 @@ def build_google_news_rss_url(locale: Locale) -> str:
     if not ceid_lang:
         ceid_lang = hl.split("-")[0].lower()  # e.g. "ja" from "ja-JP", "en" from "en-SG"
 
-    return f"https://news.google.com/rss?hl={hl}&gl={country}&ceid={country}:{ceid_lang}"
+    params = f"hl={hl}&gl={country}&ceid={country}:{ceid_lang}"
+
+    if topic:
+        topic = topic.strip().upper()
+        if topic not in GOOGLE_NEWS_TOPICS:
+            raise ValueError(f"Unknown Google News topic: {topic}")
+        return f"https://news.google.com/rss/headlines/section/topic/{topic}?{params}"
+
+    if query:
+        return f"https://news.google.com/rss/search?q={quote_plus(query.strip())}&{params}"
+
+    return f"https://news.google.com/rss?{params}"
 
 
 def resolve_locale(force_refresh: bool = False) -> Locale:
@@ -1,10 +1,25 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict, Field
+from dataclasses import dataclass
 
 
-class NewsItem(BaseModel):
-    model_config = ConfigDict(validate_by_name=True, populate_by_name=True)
+@dataclass(frozen=True, slots=True)
+class Story:
+    """One RSS entry, as fed into summarization."""
 
-    Title: str = Field(..., min_length=1)
-    News_Summary: str = Field(..., min_length=1, alias="News Summary")
+    title: str
+    link: str
+    published: str
+    source: str
+    summary: str  # raw RSS snippet (may contain HTML)
+
+
+@dataclass(frozen=True, slots=True)
+class StorySummary:
+    """One summarized story, as fed into the report. Drops the RSS snippet, keeps link and source."""
+
+    title: str
+    summary: str
+    link: str
+    source: str
+    key: str  # utils.story_key of the RSS story (the model's echoed title may differ)
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import cProfile
+import functools
+import io
+import os
+import pstats
+import re
+import subprocess
+import sys
+import time
+import tracemalloc
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import GeneratorType
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Third-party imports worth watching at startup.
+HEAVY_MODULES = ("openai", "feedparser", "markdown", "pydantic")
+
+_TOP_FUNCTIONS = 25
+_TOP_ALLOCATIONS = 10
+_MAX_STACK_DEPTH = 64
+
+
+@dataclass
+class StageStats:
+    calls: int = 0
+    wall_s: float = 0.0
+    alloc_bytes: int = 0  # net traced memory change, summed over calls
+    top_allocations: List[str] = field(default_factory=list)  # from the first call only
+
+
+class Profiler:
+    """
+    Per-stage cProfile + tracemalloc capture for --profile runs.
+
+    Stages may nest (e.g. report rendering inside the summarization loop); the outer
+    stage's profiler is paused while the inner one runs, so each function's time is
+    attributed to the innermost stage. cProfile only sees the calling thread, so work
+    done in worker threads (parallel Ollama slots, concurrent feed fetches) shows up as
+    waiting time in the stage that collects the results.
+
+    When disabled, every method is a cheap pass-through.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.stats: Dict[str, StageStats] = {}
+        self.preloaded = [m for m in HEAVY_MODULES if m in sys.modules]
+        self._profiles: Dict[str, cProfile.Profile] = {}
+        self._stack: List[cProfile.Profile] = []
+        self._active: set = set()
+        self._patched: List[Tuple[object, str, Callable]] = []
+        self._overhead_s = 0.0  # time spent in tracemalloc snapshots, excluded from wall times
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        if not self.enabled or name in self._active:
+            yield
+            return
+
+        st = self.stats.setdefault(name, StageStats())
+        prof = self._profiles.setdefault(name, cProfile.Profile())
+        first = st.calls == 0
+
+        if self._stack:
+            self._stack[-1].disable()
+        before = self._snapshot() if first else None
+        mem_before = tracemalloc.get_traced_memory()[0]
+        overhead_before = self._overhead_s
+        t0 = time.perf_counter()
+
+        self._active.add(name)
+        self._stack.append(prof)
+        prof.enable()
+        try:
+            yield
+        finally:
+            prof.disable()
+            self._stack.pop()
+            self._active.discard(name)
+
+            st.calls += 1
+            # Nested stages' first-call snapshots happen inside this stage; don't bill them to it.
+            st.wall_s += time.perf_counter() - t0 - (self._overhead_s - overhead_before)
+            st.alloc_bytes += tracemalloc.get_traced_memory()[0] - mem_before
+            if before is not None:
+                st.top_allocations = self._top_allocations(before)
+
+            if self._stack:
+                self._stack[-1].enable()
+
+    def _snapshot(self) -> tracemalloc.Snapshot:
+        t0 = time.perf_counter()
+        snap = tracemalloc.take_snapshot()
+        self._overhead_s += time.perf_counter() - t0
+        return snap
+
+    def _top_allocations(self, before: tracemalloc.Snapshot) -> List[str]:
+        t0 = time.perf_counter()
+        diff = tracemalloc.take_snapshot().compare_to(before, "lineno")
+        top = [str(d) for d in diff[:_TOP_ALLOCATIONS]]
+        self._overhead_s += time.perf_counter() - t0
+        return top
+
+    def iterate(self, name: str, it: Iterator) -> Iterator:
+        """Profile each step of a lazy iterator as `name`, leaving the consumer's work outside the stage."""
+        if not self.enabled:
+            return it
+        return self._iterate(name, it)
+
+    def _iterate(self, name: str, it: Iterator) -> Iterator:
+        try:
+            while True:
+                with self.stage(name):
+                    try:
+                        item = next(it)
+                    except StopIteration:
+                        return
+                yield item
+        finally:
+            close = getattr(it, "close", None)
+            if close:
+                close()
+
+    def wrap(self, fn: Callable, name: Optional[str] = None) -> Callable:
+        name = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with self.stage(name):
+                result = fn(*args, **kwargs)
+            if isinstance(result, GeneratorType):
+                return self._iterate(name, result)
+            return result
+
+        return wrapper
+
+    def instrument(self, module: object, names: Sequence[str]) -> None:
+        """Swap module-level functions for profiled wrappers (undone by `restore`)."""
+        if not self.enabled:
+            return
+        for name in names:
+            fn = getattr(module, name)
+            self._patched.append((module, name, fn))
+            setattr(module, name, self.wrap(fn, name))
+
+    def restore(self) -> None:
+        for module, name, fn in reversed(self._patched):
+            setattr(module, name, fn)
+        self._patched = []
+
+    def write(self, out_dir: str) -> str:
+        """
+        Write per-stage `<stage>.pstats` and `<stage>.collapsed` (flamegraph.pl / speedscope
+        input), plus `summary.txt` and `imports.txt`. Returns the directory path.
+        """
+        self.restore()
+        out = Path(out_dir)
+        out.mkdir(parents=True, exist_ok=True)
+
+        summary = io.StringIO()
+        summary.write(f"Heavy modules already imported at startup: {', '.join(self.preloaded) or 'none'}\n\n")
+        summary.write(f"{'stage':<32} {'calls':>6} {'wall s':>9} {'net alloc KiB':>14}\n")
+        for name, st in self.stats.items():
+            summary.write(f"{name:<32} {st.calls:>6} {st.wall_s:>9.3f} {st.alloc_bytes / 1024:>14.1f}\n")
+
+        for name, prof in self._profiles.items():
+            prof.dump_stats(str(out / f"{name}.pstats"))
+            stats = pstats.Stats(prof)
+            (out / f"{name}.collapsed").write_text("\n".join(collapsed_stacks(stats)) + "\n", encoding="utf-8")
+
+            summary.write(f"\n=== {name}: top {_TOP_FUNCTIONS} by cumulative time\n")
+            pstats.Stats(prof, stream=summary).sort_stats("cumulative").print_stats(_TOP_FUNCTIONS)
+            summary.write(f"=== {name}: top allocations (first call)\n")
+            for line in self.stats[name].top_allocations:
+                summary.write(f"  {line}\n")
+
+        (out / "summary.txt").write_text(summary.getvalue(), encoding="utf-8")
+        (out / "imports.txt").write_text(format_import_times(measure_import_times()), encoding="utf-8")
+
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+        return str(out.resolve())
+
+
+def profile_dir_for(output_path: str) -> str:
+    """`out/index.html` -> `out/index.profile`."""
+    p = Path(output_path)
+    return str(p.with_name(p.stem + ".profile"))
+
+
+def collapsed_stacks(stats: pstats.Stats) -> List[str]:
+    """
+    Approximate collapsed stacks ("a;b;c <microseconds>") from cProfile's caller/callee edges.
+    cProfile doesn't keep full stacks, so a callee's time is split across callers
+    in proportion to each call edge's cumulative time.
+    """
+    raw = stats.stats  # type: ignore[attr-defined]
+    callees: Dict[tuple, Dict[tuple, float]] = defaultdict(dict)
+    for func, (_, _, _, _, callers) in raw.items():
+        for caller, edge in callers.items():
+            callees[caller][func] = edge[3]
+
+    def label(func: tuple) -> str:
+        filename, line, name = func
+        text = name if filename == "~" else f"{name} ({os.path.basename(filename)}:{line})"
+        return text.replace(";", ":")
+
+    out: Counter = Counter()
+
+    def walk(func: tuple, path: Tuple[str, ...], scale: float, on_path: set) -> None:
+        _, _, tt, ct, _ = raw[func]
+        path = path + (label(func),)
+        self_us = int(tt * scale * 1e6)
+        if self_us:
+            out[";".join(path)] += self_us
+        if len(path) >= _MAX_STACK_DEPTH:
+            return
+        on_path.add(func)
+        for child, edge_ct in callees.get(func, {}).items():
+            child_ct = raw[child][3]
+            if child in on_path or child_ct <= 0:
+                continue
+            child_scale = scale * edge_ct / child_ct
+            if child_scale * child_ct * 1e6 >= 1:
+                walk(child, path, child_scale, on_path)
+        on_path.discard(func)
+
+    for func, (_, _, _, _, callers) in raw.items():
+        if not callers:
+            walk(func, (), 1.0, set())
+
+    return [f"{stack} {us}" for stack, us in out.most_common()]
+
+
+def measure_import_times(modules: Sequence[str] = HEAVY_MODULES) -> Dict[str, Optional[int]]:
+    """
+    Cumulative import time (microseconds) of each module, measured standalone in a fresh
+    interpreter with `-X importtime`, so the result doesn't depend on what this process loaded.
+    """
+    results: Dict[str, Optional[int]] = {}
+    for mod in modules:
+        try:
+            proc = subprocess.run(
+                [sys.executable, "-X", "importtime", "-c", f"import {mod}"],
+                capture_output=True,
+                text=True,
+                timeout=120,
+            )
+        except Exception:
+            results[mod] = None
+            continue
+
+        results[mod] = None
+        if proc.returncode != 0:
+            continue
+        for line in proc.stderr.splitlines():
+            m = re.match(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|\s+(.*)$", line)
+            if m and m.group(3).strip() == mod:
+                results[mod] = int(m.group(2))
+    return results
+
+
+def format_import_times(times: Dict[str, Optional[int]]) -> str:
+    lines = [f"{'module':<16} {'cumulative ms':>14}"]
+    for mod, us in sorted(times.items(), key=lambda kv: -(kv[1] or 0)):
+        value = f"{us / 1000:.1f}" if us is not None else "not installed"
+        lines.append(f"{mod:<16} {value:>14}")
+    return "\n".join(lines) + "\n"
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import os
+import tempfile
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
-import markdown as md
+from news_summarizer.models import StorySummary
+
+_SPOOL_CHUNK_CHARS = 64 * 1024
 
 CSS = """
 :root{
@@ -47,6 +52,7 @@ body{
   box-shadow: var(--shadow);
 }
 .card h2{ margin:0 0 10px; font-size: 18px; }
+h2.section{ margin: 32px 0 0; padding-left: 6px; font-size: 22px; color: var(--muted); }
 .card p{ margin: 10px 0; line-height: 1.6; color: var(--text); }
 a{ color: var(--link); text-decoration: none; }
 a:hover{ text-decoration: underline; }
@@ -61,8 +67,7 @@ code{
 """
 
 
-def build_markdown_report(items: List[dict], rss_url: str, stories: List[dict], llm_provider: str) -> str:
-    link_map = {s.get("title", ""): s.get("link", "") for s in stories}
+def build_markdown_header(rss_url: str, llm_provider: str, done: Optional[int] = None, total: Optional[int] = None) -> str:
     now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
 
     lines: List[str] = []
@@ -74,79 +79,223 @@ def build_markdown_report(items: List[dict], rss_url: str, stories: List[dict],
     lines.append("")
     lines.append(f"- LLM Provider: `{llm_provider}`")
     lines.append("")
+    if total is not None:
+        lines.append(f"- Progress: **{done or 0}/{total}** stories (in progress)")
+        lines.append("")
     lines.append("---")
     lines.append("")
 
-    for i, item in enumerate(items, start=1):
-        title = item.get("Title", "").strip()
-        summary = item.get("News Summary", "").strip()
-        link = link_map.get(title, "").strip()
+    return "\n".join(lines)
 
-        lines.append(f"## {i}. [{title}]({link})" if link else f"## {i}. {title}")
-        lines.append("")
-        lines.append(summary)
-        lines.append("")
-        lines.append("---")
-        lines.append("")
+
+def build_markdown_card(index: int, item: StorySummary) -> str:
+    title = item.title
+    link = item.link
+
+    lines: List[str] = []
+    lines.append(f"## {index}. [{title}]({link})" if link else f"## {index}. {title}")
+    lines.append("")
+    lines.append(item.summary)
+    lines.append("")
+    lines.append("---")
+    lines.append("")
 
     return "\n".join(lines)
 
 
+def build_markdown_section(title: str) -> str:
+    # attr_list (part of "extra") tags the heading so the page script keeps it outside the cards.
+    return f"## {title} {{: .section }}\n"
+
+
+_MARKDOWN_EXTENSIONS = ["extra", "sane_lists"]
+_md = None
+
+
+def load_markdown():
+    """Import markdown and its extensions. Done on first render rather than at startup."""
+    global _md
+    if _md is None:
+        import markdown
+
+        markdown.Markdown(extensions=_MARKDOWN_EXTENSIONS)  # extension modules load on first use
+        _md = markdown
+    return _md
+
+
 def markdown_to_html(markdown_text: str) -> str:
-    return md.markdown(markdown_text, extensions=["extra", "sane_lists"])
-
-
-def wrap_html(body_html: str) -> str:
-    return (
-        "<!doctype html>\n"
-        "<html lang=\"en\">\n"
-        "<head>\n"
-        "  <meta charset=\"utf-8\" />\n"
-        "  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />\n"
-        "  <title>News Summary</title>\n"
-        f"  <style>{CSS}</style>\n"
-        "</head>\n"
-        "<body>\n"
-        "  <div class=\"container\">\n"
-        "    <div class=\"header\"></div>\n"
-        "    <div id=\"content\">\n"
-        f"{body_html}\n"
-        "    </div>\n"
-        "    <div class=\"footer\">Tip: You can schedule this daily with Task Scheduler / cron.</div>\n"
-        "  </div>\n"
-        "  <script>\n"
-        "    (function() {\n"
-        "      const content = document.getElementById(\"content\");\n"
-        "      const nodes = Array.from(content.children);\n"
-        "      const newNodes = [];\n"
-        "      let currentCard = null;\n"
-        "      function flushCard() { if (currentCard) { newNodes.push(currentCard); currentCard = null; } }\n"
-        "      for (const node of nodes) {\n"
-        "        if (node.tagName === \"H1\") { document.querySelector(\".header\").appendChild(node); continue; }\n"
-        "        if (node.tagName === \"UL\") { node.className = \"meta\"; document.querySelector(\".header\").appendChild(node); continue; }\n"
-        "        if (node.tagName === \"HR\") continue;\n"
-        "        if (node.tagName === \"H2\") {\n"
-        "          flushCard();\n"
-        "          currentCard = document.createElement(\"div\");\n"
-        "          currentCard.className = \"card\";\n"
-        "          currentCard.appendChild(node);\n"
-        "          continue;\n"
-        "        }\n"
-        "        if (!currentCard) { currentCard = document.createElement(\"div\"); currentCard.className = \"card\"; }\n"
-        "        currentCard.appendChild(node);\n"
-        "      }\n"
-        "      flushCard();\n"
-        "      content.innerHTML = \"\";\n"
-        "      for (const n of newNodes) content.appendChild(n);\n"
-        "    })();\n"
-        "  </script>\n"
-        "</body>\n"
-        "</html>\n"
-    )
-
-
-def write_html(output_path: str, html: str) -> str:
+    return load_markdown().markdown(markdown_text, extensions=_MARKDOWN_EXTENSIONS)
+
+
+_HTML_HEAD = (
+    "<!doctype html>\n"
+    "<html lang=\"en\">\n"
+    "<head>\n"
+    "  <meta charset=\"utf-8\" />\n"
+    "  <meta name=\"viewport\" content=\"width=device-width, initial-scale=1\" />\n"
+    "  <title>News Summary</title>\n"
+    f"  <style>{CSS}</style>\n"
+    "</head>\n"
+    "<body>\n"
+    "  <div class=\"container\">\n"
+    "    <div class=\"header\"></div>\n"
+    "    <div id=\"content\">\n"
+)
+
+_HTML_TAIL = (
+    "\n"
+    "    </div>\n"
+    "    <div class=\"footer\">Tip: You can schedule this daily with Task Scheduler / cron.</div>\n"
+    "  </div>\n"
+    "  <script>\n"
+    "    (function() {\n"
+    "      const content = document.getElementById(\"content\");\n"
+    "      const nodes = Array.from(content.children);\n"
+    "      const newNodes = [];\n"
+    "      let currentCard = null;\n"
+    "      function flushCard() { if (currentCard) { newNodes.push(currentCard); currentCard = null; } }\n"
+    "      for (const node of nodes) {\n"
+    "        if (node.tagName === \"H1\") { document.querySelector(\".header\").appendChild(node); continue; }\n"
+    "        if (node.tagName === \"UL\") { node.className = \"meta\"; document.querySelector(\".header\").appendChild(node); continue; }\n"
+    "        if (node.tagName === \"HR\") continue;\n"
+    "        if (node.tagName === \"H2\" && node.classList.contains(\"section\")) { flushCard(); newNodes.push(node); continue; }\n"
+    "        if (node.tagName === \"H2\") {\n"
+    "          flushCard();\n"
+    "          currentCard = document.createElement(\"div\");\n"
+    "          currentCard.className = \"card\";\n"
+    "          currentCard.appendChild(node);\n"
+    "          continue;\n"
+    "        }\n"
+    "        if (!currentCard) { currentCard = document.createElement(\"div\"); currentCard.className = \"card\"; }\n"
+    "        currentCard.appendChild(node);\n"
+    "      }\n"
+    "      flushCard();\n"
+    "      content.innerHTML = \"\";\n"
+    "      for (const n of newNodes) content.appendChild(n);\n"
+    "    })();\n"
+    "  </script>\n"
+    "</body>\n"
+    "</html>\n"
+)
+
+
+def wrap_html(body_chunks: Iterable[str]) -> Iterator[str]:
+    yield _HTML_HEAD
+    yield from body_chunks
+    yield _HTML_TAIL
+
+
+def write_html(output_path: str, chunks: Iterable[str]) -> str:
     out = Path(output_path)
     out.parent.mkdir(parents=True, exist_ok=True)
-    out.write_text(html, encoding="utf-8")
+    # Write-then-rename so a browser reloading mid-run never sees a half-written file.
+    tmp = out.with_name(out.name + ".tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp, out)
     return str(out.resolve())
+
+
+class ProgressiveReportWriter:
+    """
+    Re-writes the HTML report as stories complete, so the first card is visible
+    after one LLM call instead of after the whole run.
+
+    Each card is converted to HTML once and spooled to a temporary file, so the
+    writer's memory doesn't grow with the number of stories; every rewrite streams
+    the spool into the output. Rewrites are throttled to `flush_interval_s`.
+
+    With `sections` (title, story keys) the report is grouped by section, and a story
+    listed in several sections is rendered in each of them from a single summary.
+    Only spool offsets are kept per section card.
+    """
+
+    def __init__(
+        self,
+        output_path: str,
+        rss_url: str,
+        llm_provider: str,
+        total: Optional[int] = None,
+        flush_interval_s: float = 1.0,
+        sections: Optional[Sequence[Tuple[str, Sequence[str]]]] = None,
+    ) -> None:
+        self.output_path = output_path
+        self.rss_url = rss_url
+        self.llm_provider = llm_provider
+        self.total = total
+        self.flush_interval_s = flush_interval_s
+        self.sections = list(sections or [])
+
+        # key -> [(section index, card number)]
+        self._slots: Dict[str, List[Tuple[int, int]]] = {}
+        for si, (_, keys) in enumerate(self.sections):
+            for pos, key in enumerate(keys, start=1):
+                self._slots.setdefault(key, []).append((si, pos))
+
+        self._spool = tempfile.TemporaryFile("w+", encoding="utf-8")
+        self.reset(llm_provider)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def reset(self, llm_provider: str) -> None:
+        self.llm_provider = llm_provider
+        self._count = 0
+        self._spool.seek(0)
+        self._spool.truncate()
+        self._section_cards: List[Dict[str, Tuple[int, int]]] = [{} for _ in self.sections]
+        self._loose: List[Tuple[int, int]] = []  # sectioned mode: cards matching no section
+        self._last_flush = 0.0
+
+    def _spool_card(self, card_html: str) -> Tuple[int, int]:
+        self._spool.seek(0, os.SEEK_END)
+        offset = self._spool.tell()
+        self._spool.write(card_html + "\n")
+        return offset, len(card_html) + 1
+
+    def _read_card(self, span: Tuple[int, int]) -> str:
+        self._spool.seek(span[0])
+        return self._spool.read(span[1])
+
+    def add(self, item: StorySummary) -> None:
+        self._count += 1
+        if not self.sections:
+            self._spool_card(markdown_to_html(build_markdown_card(self._count, item)))
+        else:
+            key = item.key
+            slots = self._slots.get(key, [])
+            for si, pos in slots:
+                self._section_cards[si][key] = self._spool_card(markdown_to_html(build_markdown_card(pos, item)))
+            if not slots:
+                # Not part of any section: append after them.
+                self._loose.append(self._spool_card(markdown_to_html(build_markdown_card(len(self._loose) + 1, item))))
+
+        now = time.monotonic()
+        if self._count == 1 or now - self._last_flush >= self.flush_interval_s:
+            self._write(total=self.total)
+            self._last_flush = now
+
+    def finish(self) -> str:
+        path = self._write(total=None)
+        self._spool.close()
+        return path
+
+    def _body_chunks(self, total: Optional[int]) -> Iterator[str]:
+        yield markdown_to_html(build_markdown_header(self.rss_url, self.llm_provider, done=self.count, total=total))
+        yield "\n"
+        if not self.sections:
+            self._spool.seek(0)
+            yield from iter(lambda: self._spool.read(_SPOOL_CHUNK_CHARS), "")
+            return
+        for (title, keys), cards in zip(self.sections, self._section_cards):
+            yield markdown_to_html(build_markdown_section(title)) + "\n"
+            for key in keys:
+                if key in cards:
+                    yield self._read_card(cards[key])
+        for span in self._loose:
+            yield self._read_card(span)
+
+    def _write(self, total: Optional[int]) -> str:
+        return write_html(self.output_path, wrap_html(self._body_chunks(total)))
@@ -1,27 +1,98 @@
 from __future__ import annotations
 
-from typing import List
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import Iterator, List, Optional, Sequence
 
 import feedparser
 import requests
+from requests.adapters import HTTPAdapter
 
+from news_summarizer.models import Story
+from news_summarizer.utils import story_key
 
-def fetch_google_news_top_stories(rss_url: str, timeout_s: int = 20) -> feedparser.FeedParserDict:
-    resp = requests.get(rss_url, timeout=timeout_s)
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class FeedSection:
+    title: str
+    rss_url: str
+
+
+def fetch_google_news_top_stories(
+    rss_url: str,
+    timeout_s: int = 20,
+    session: Optional[requests.Session] = None,
+) -> feedparser.FeedParserDict:
+    resp = (session or requests).get(rss_url, timeout=timeout_s)
     resp.raise_for_status()
     return feedparser.parse(resp.text)
 
 
-def extract_entries(feed: feedparser.FeedParserDict, limit: int) -> List[dict]:
-    entries = []
-    for e in (feed.entries or [])[:limit]:
-        entries.append(
-            {
-                "title": getattr(e, "title", "").strip(),
-                "link": getattr(e, "link", "").strip(),
-                "published": getattr(e, "published", "").strip(),
-                "source": getattr(getattr(e, "source", None), "title", "") if getattr(e, "source", None) else "",
-                "summary": getattr(e, "summary", "").strip(),
-            }
+def fetch_feeds(rss_urls: Sequence[str], timeout_s: int = 20) -> List[feedparser.FeedParserDict]:
+    """
+    Fetch several feeds concurrently over one pooled session.
+    A feed that fails is logged and returned empty, so one bad section doesn't sink the run.
+    """
+    workers = max(1, len(rss_urls))
+    with requests.Session() as session:
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        def fetch(url: str) -> feedparser.FeedParserDict:
+            try:
+                return fetch_google_news_top_stories(url, timeout_s=timeout_s, session=session)
+            except Exception:
+                logger.exception("Failed fetching RSS feed: %s", url)
+                return feedparser.FeedParserDict(entries=[])
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(fetch, rss_urls))
+
+
+def count_entries(feed: feedparser.FeedParserDict, limit: int) -> int:
+    return min(limit, len(feed.entries or []))
+
+
+def extract_entries(feed: feedparser.FeedParserDict, limit: int) -> Iterator[Story]:
+    """Lazily yield up to `limit` stories from the feed."""
+    for e in islice(feed.entries or [], limit):
+        source = getattr(e, "source", None)
+        yield Story(
+            title=getattr(e, "title", "").strip(),
+            link=getattr(e, "link", "").strip(),
+            published=getattr(e, "published", "").strip(),
+            source=(getattr(source, "title", "") or "").strip() if source else "",
+            summary=getattr(e, "summary", "").strip(),
         )
-    return entries
+
+
+def section_keys(feeds: Sequence[feedparser.FeedParserDict], limit: int) -> List[List[str]]:
+    """Story keys per feed (first `limit` entries each, duplicates within a feed dropped)."""
+    sections = []
+    for feed in feeds:
+        keys: List[str] = []
+        seen = set()
+        for story in extract_entries(feed, limit):
+            key = story_key(story.link, story.title)
+            if key not in seen:
+                seen.add(key)
+                keys.append(key)
+        sections.append(keys)
+    return sections
+
+
+def iter_unique_stories(feeds: Sequence[feedparser.FeedParserDict], limit: int) -> Iterator[Story]:
+    """Merge feeds in order, yielding each story once (by canonical link) so shared stories are summarized once."""
+    seen = set()
+    for feed in feeds:
+        for story in extract_entries(feed, limit):
+            key = story_key(story.link, story.title)
+            if key in seen:
+                continue
+            seen.add(key)
+            yield story
@@ -1,23 +1,24 @@
 from __future__ import annotations
 
 import json
-from typing import List
-
-from pydantic import ValidationError
-
-from news_summarizer.llm.base import LLMProvider
-from news_summarizer.models import NewsItem
-from news_summarizer.utils import extract_first_json_object, strip_html
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Iterable, Iterator, Optional, Tuple
+
+from news_summarizer.llm.base import LLMProvider, StreamingLLMProvider
+from news_summarizer.models import Story, StorySummary
+from news_summarizer.utils import JsonStreamCollector, extract_first_json_object, story_key, strip_html
 from news_summarizer.llm.base import LLMBlockedByRegionError
 
 
 
-def build_summary_prompt(story: dict, max_chars: int, target_language: str) -> str:
-    title = story.get("title", "").strip()
-    link = story.get("link", "").strip()
-    source = story.get("source", "").strip()
-    published = story.get("published", "").strip()
-    snippet = strip_html(story.get("summary", ""))
+def build_summary_prompt(story: Story, max_chars: int, target_language: str) -> str:
+    title = story.title
+    link = story.link
+    source = story.source
+    published = story.published
+    snippet = strip_html(story.summary)
 
     return f"""
     You are summarizing a news headline for a daily briefing.
@@ -47,16 +48,50 @@ def build_summary_prompt(story: dict, max_chars: int, target_language: str) -> s
     """.strip()
 
 
+def stream_summary_text(llm: StreamingLLMProvider, prompt: str, max_chars: int) -> str:
+    """
+    Stream the completion and stop as soon as the JSON object is closed
+    or the summary runs past max_chars.
+    """
+    collector = JsonStreamCollector(truncate_key="News Summary", max_chars=max_chars, require_keys=("Title",))
+    chunks = llm.stream_text(prompt)
+    try:
+        for chunk in chunks:
+            if collector.feed(chunk):
+                break
+    finally:
+        close = getattr(chunks, "close", None)
+        if close:
+            close()
+    return collector.text().strip()
+
+
+def _parse_item(data: object) -> Tuple[str, str]:
+    # Same contract as schema.NewsItem (non-empty "Title" / "News Summary"), without a per-item model round-trip.
+    if not isinstance(data, dict):
+        raise ValueError("not a JSON object")
+    title = data.get("Title")
+    summary = data.get("News Summary", data.get("News_Summary"))
+    if not isinstance(title, str) or not title.strip():
+        raise ValueError("missing 'Title'")
+    if not isinstance(summary, str) or not summary.strip():
+        raise ValueError("missing 'News Summary'")
+    return title.strip(), summary.strip()
+
+
 def summarize_one_story(
     llm: LLMProvider,
-    story: dict,
+    story: Story,
     max_chars: int,
     target_language: str,
-) -> NewsItem:
+    stream: bool = False,
+) -> StorySummary:
     prompt = build_summary_prompt(story, max_chars=max_chars, target_language=target_language)
 
-
-    text = llm.generate_text(prompt)
+    if stream and isinstance(llm, StreamingLLMProvider):
+        text = stream_summary_text(llm, prompt, max_chars=max_chars)
+    else:
+        text = llm.generate_text(prompt)
     if not text:
         raise RuntimeError("Empty model response.")
 
@@ -67,45 +102,97 @@ def summarize_one_story(
         raise RuntimeError(f"Model did not return valid JSON. Raw output:\n{text}") from e
 
     try:
-        return NewsItem.model_validate(data)
-    except ValidationError as e:
+        title, summary = _parse_item(data)
+    except ValueError as e:
         raise RuntimeError(f"JSON schema validation failed. Got:\n{data}") from e
 
+    return StorySummary(
+        title=title,
+        summary=summary,
+        link=story.link,
+        source=story.source,
+        key=story_key(story.link, story.title),
+    )
+
 
 def summarize_stories(
     llm: LLMProvider,
-    stories: List[dict],
+    stories: Iterable[Story],
     max_chars: int,
     fail_fast: bool,
     logger,
     target_language: str,
-) -> List[dict]:
+    stream: bool = False,
+    total: Optional[int] = None,
+) -> Iterator[StorySummary]:
+    """
+    Lazily summarize stories, yielding results in story order.
+    Only a small window of stories is in flight at once, so memory stays bounded for long feeds.
+    """
+    total_label = str(total) if total is not None else "?"
+
+    def titled() -> Iterator[Tuple[int, Story]]:
+        for idx, story in enumerate(stories, start=1):
+            if not story.title:
+                logger.warning("Skipping story %d: missing title", idx)
+                continue
+            yield idx, story
+
+    def run(idx: int, story: Story) -> StorySummary:
+        logger.info("Summarizing %d/%s: %s", idx, total_label, story.title[:80])
+        return summarize_one_story(llm, story, max_chars=max_chars, target_language=target_language, stream=stream)
+
+    todo = titled()
+
+    # Providers that can serve parallel requests (e.g. Ollama with OLLAMA_NUM_PARALLEL > 1)
+    # advertise it via `concurrency`; results are still yielded in story order.
+    workers = max(1, int(getattr(llm, "concurrency", 1)))
+    pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    pending: deque = deque()
+
+    def fill() -> None:
+        while pool and len(pending) < workers * 2:
+            nxt = next(todo, None)
+            if nxt is None:
+                return
+            pending.append((nxt[0], pool.submit(run, *nxt)))
 
-    results: List[dict] = []
-
-    for idx, story in enumerate(stories, start=1):
-        title = story.get("title", "").strip()
-        if not title:
-            logger.warning("Skipping story %d: missing title", idx)
-            continue
-
-        logger.info("Summarizing %d/%d: %s", idx, len(stories), title[:80])
-
-        try:
-            item = summarize_one_story(llm, story, max_chars=max_chars, target_language=target_language)
-            results.append(item.model_dump(by_alias=True))
-
-        except LLMBlockedByRegionError:
-            # Expected in some VPN regions (HK). Don't spam traceback; re-raise to trigger fallback in main.
-            logger.warning("LLM blocked by region. Triggering provider fallback.")
-            raise
-
-        except Exception as e:
-            # Unexpected errors: keep traceback (useful for debugging)
-            logger.exception("Failed summarizing story %d", idx)
-            if fail_fast:
+    try:
+        fill()
+        while True:
+            if pool:
+                if not pending:
+                    break
+                idx, fut = pending.popleft()
+                fill()
+                get = fut.result
+            else:
+                nxt = next(todo, None)
+                if nxt is None:
+                    break
+                idx = nxt[0]
+                get = partial(run, *nxt)
+
+            try:
+                item = get()
+
+            except LLMBlockedByRegionError:
+                # Expected in some VPN regions (HK). Don't spam traceback; re-raise to trigger fallback in main.
+                logger.warning("LLM blocked by region. Triggering provider fallback.")
                 raise
-            # else: continue
-
 
-    return results
+            except Exception as e:
+                # Unexpected errors: keep traceback (useful for debugging)
+                logger.exception("Failed summarizing story %d", idx)
+                if fail_fast:
+                    raise
+                continue
+
+            yield item
+    finally:
+        if pool:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    timing_summary = getattr(llm, "timing_summary", None)
+    if callable(timing_summary):
+        logger.info("LLM timings: %s", timing_summary())
@@ -1,12 +1,40 @@
 from __future__ import annotations
 
 import re
+from typing import List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query params that only track the referrer; everything else may identify the story (?p=123, ?id=...).
+_TRACKING_PARAMS = {"oc", "fbclid", "gclid"}
 
 
 def strip_html(text: str) -> str:
     return re.sub(r"<[^>]+>", "", text or "").strip()
 
 
+def canonical_link(url: str) -> str:
+    """
+    Normalize a story link for de-duplication: lowercase scheme/host, drop the fragment,
+    trailing slash and tracking params (Google News adds ?oc=5 per feed; utm_* campaigns).
+    Other query params are kept, since they often identify the story.
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    parts = urlsplit(url)
+    query = [
+        (k, v)
+        for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in _TRACKING_PARAMS and not k.lower().startswith("utm_")
+    ]
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), urlencode(query), ""))
+
+
+def story_key(link: str, title: str) -> str:
+    """Identity of a story across feeds: canonical link, or the title when there is no link."""
+    return canonical_link(link) or f"title:{title.strip()}"
+
+
 def extract_first_json_object(text: str) -> str:
     """
     Extract the first JSON object from a string.
@@ -33,3 +61,143 @@ def extract_first_json_object(text: str) -> str:
                 return cleaned[start : i + 1]
 
     raise ValueError(f"Unclosed JSON object in model output:\n{cleaned}")
+
+
+_SENTENCE_ENDS = ".!?。！？"
+
+
+class JsonStreamCollector:
+    """
+    Incrementally collect the first JSON object from a token stream.
+
+    `feed()` returns True once the object is closed, or once the value of `truncate_key`
+    grows past `max_chars` (after all `require_keys` are complete). In the latter case the
+    value is cut at the last sentence end (or hard-cut with an ellipsis) and the object is
+    closed, so the caller can stop generation instead of paying for the remaining tokens.
+    """
+
+    def __init__(
+        self,
+        truncate_key: Optional[str] = None,
+        max_chars: Optional[int] = None,
+        require_keys: Tuple[str, ...] = (),
+    ) -> None:
+        self.truncate_key = truncate_key
+        self.max_chars = max_chars
+        self.require_keys = set(require_keys)
+
+        self.done = False
+        self.truncated = False
+        self._buf: List[str] = []
+        self._prefix: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._is_value = False
+        self._escape = False
+        self._hex_left = 0
+        self._prev_sig = ""
+        self._key_chars: List[str] = []
+        self._last_key = ""
+        self._done_keys: set = set()
+        self._value_start = 0
+        self._value_len = 0
+        self._safe_cut = 0
+
+    def feed(self, chunk: str) -> bool:
+        for ch in chunk:
+            if self.done:
+                break
+            self._feed_char(ch)
+        return self.done
+
+    def text(self) -> str:
+        """Collected JSON text (or the raw output if no object was found)."""
+        if not self._buf:
+            return "".join(self._prefix)
+        return "".join(self._buf)
+
+    def _feed_char(self, ch: str) -> None:
+        if self._depth == 0:
+            if ch != "{":
+                self._prefix.append(ch)
+                return
+            self._depth = 1
+            self._buf.append(ch)
+            return
+
+        self._buf.append(ch)
+
+        if self._in_string:
+            if self._hex_left:
+                self._hex_left -= 1
+                if self._hex_left == 0:
+                    self._end_string_char()
+            elif self._escape:
+                self._escape = False
+                if ch == "u":
+                    self._hex_left = 4
+                else:
+                    self._end_string_char(ch)
+            elif ch == "\\":
+                self._escape = True
+            elif ch == '"':
+                self._in_string = False
+                self._prev_sig = '"'
+                if self._is_value:
+                    if self._depth == 1:
+                        self._done_keys.add(self._last_key)
+                else:
+                    self._last_key = "".join(self._key_chars)
+            else:
+                self._end_string_char(ch)
+            return
+
+        if ch == '"':
+            self._in_string = True
+            self._is_value = self._prev_sig == ":"
+            self._key_chars = []
+            self._value_start = len(self._buf)
+            self._value_len = 0
+            self._safe_cut = len(self._buf)
+        elif ch in "{[":
+            self._depth += 1
+        elif ch in "}]":
+            self._depth -= 1
+            if self._depth == 0:
+                self.done = True
+        if not ch.isspace():
+            self._prev_sig = ch
+
+    def _end_string_char(self, ch: str = "") -> None:
+        # Called once per decoded character inside a string.
+        if not self._is_value:
+            self._key_chars.append(ch)
+            return
+
+        self._value_len += 1
+        if (
+            self.max_chars is not None
+            and self._depth == 1
+            and self._last_key == self.truncate_key
+            and self._value_len > self.max_chars
+            and self.require_keys <= self._done_keys
+        ):
+            self._truncate()
+        else:
+            self._safe_cut = len(self._buf)
+
+    def _truncate(self) -> None:
+        value = self._buf[self._value_start : self._safe_cut]
+        cut = None
+        for i in range(len(value) - 1, len(value) // 2 - 1, -1):
+            if value[i] in _SENTENCE_ENDS:
+                cut = self._value_start + i + 1
+                break
+
+        if cut is None:
+            self._buf = self._buf[: self._safe_cut] + ["…"]
+        else:
+            self._buf = self._buf[:cut]
+        self._buf.extend('"}')
+        self.truncated = True
+        self.done = True